@@ -1,17 +1,9 @@
 """
 DAGVIZ provides a simple visualization of Directed Acyclic Graphs.
 """
-try:
-    import importlib.metadata as importlib_metadata  # type: ignore
-except ModuleNotFoundError:
-    import importlib_metadata
+from __future__ import annotations
 
-__version__ = importlib_metadata.version(__name__)
-
-from typing import Any, Callable, Sequence, Union
-
-import networkx as nx
-from networkx.algorithms import dag
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Tuple, Union
 
 from .abstract import AbstractPlot
 from .dagre import Dagre  # noqa
@@ -19,11 +11,26 @@ from .istyle import iStyle
 from .render import render
 from .style import metro
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+def __getattr__(name: str) -> Any:
+    # Resolving the installed version imports importlib.metadata and scans
+    # the environment; defer that until somebody asks for it.
+    if name == "__version__":
+        try:
+            import importlib.metadata as importlib_metadata  # type: ignore
+        except ModuleNotFoundError:
+            import importlib_metadata  # type: ignore
+        return importlib_metadata.version(__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def make_abstract_plot(
         G: nx.Graph,
         *,
-        order: Union[Sequence[Any], Callable[..., Sequence[Any]]] = dag.topological_sort,
+        order: Union[Sequence[Any], Callable[..., Sequence[Any]], None] = None,
 ) -> AbstractPlot:
     """
     Generate an abstract plot for a DAG.
@@ -40,38 +47,60 @@ def make_abstract_plot(
         An abstract plot of the graph that can be used to render an image from.
     """
     plot = AbstractPlot()
+    if order is None:
+        # NetworkX is only needed for the default ordering; importing it
+        # lazily keeps `import dagviz` fast for callers that bring their
+        # own order.
+        from networkx.algorithms.dag import topological_sort
+
+        order = topological_sort
     if isinstance(order, Sequence):
         sequence = order
     else:
         sequence = order(G)
 
+    # Hoist the NetworkX views out of the loop; each G.<view> access is a
+    # fresh dict lookup that would otherwise repeat for every node.
+    nodes = G.nodes
+    pred = G.pred
+    succ = G.succ
+    add_row = plot.add_row
+
     # Iterate over each node in the sequence
     for nd in sequence:
         # Add a row to the plot with the node's label
-        row = plot.add_row(G.nodes[nd].get("label", f"{nd}"))
+        row = add_row(nodes[nd].get("label", f"{nd}"))
 
-        # Add inputs to the row for each predecessor of the node
-        for pred in G.pred[nd]:
-            row.add_input(pred)
+        # Add inputs to the row for each predecessor of the node. Root
+        # nodes are common in sparse DAGs; skip the iterator setup for
+        # their empty predecessor views entirely.
+        preds = pred[nd]
+        if preds:
+            add_input = row.add_input
+            for p in preds:
+                add_input(p)
 
         # Add the node to the row with the number of its successors
-        row.add_node(nd, len(G.succ[nd]))
+        row.add_node(nd, len(succ[nd]))
 
     return plot
 
 
 def render_svg(
-        G: nx.Graph, *, style: Callable[..., iStyle] = metro.svg_renderer()
+        G: nx.Graph, *, style: Optional[Callable[..., iStyle]] = None
 ) -> str:
     """
     Generate a DAG visualization as an SVG string.
 
     Args:
         G:     The DAG to visualize
-        style: Optional; The visualization style to apply
+        style: Optional; The visualization style to apply. Defaults to the
+               metro style.
     Returns:
         A string containing the SVG of the plot
     """
+    if style is None:
+        style = metro.svg_renderer()
     return render(make_abstract_plot(G), style)
 
 
@@ -80,12 +109,40 @@ class Metro:
     Render a topological ordering of a DAG using the "metro" style in
     jupyter notebooks.
 
+    Notebooks may request the representation of the same object several
+    times, so the abstract plot and the rendered SVG are computed once and
+    reused for as long as the graph keeps the same node and edge counts.
+    Call `invalidate` after a mutation that preserves those counts, such
+    as relabeling a node or rewiring an edge.
+
     Args:
         G: directed acyclic graph to render
     """
 
     def __init__(self, G: nx.DiGraph):
         self.graph = G
+        self._plot: Optional[AbstractPlot] = None
+        self._plot_key: Optional[Tuple[int, int]] = None
+        self._svg: Optional[str] = None
+
+    def invalidate(self) -> None:
+        """
+        Discard the cached plot and SVG, forcing the next render to
+        recompute them from the graph.
+        """
+        self._plot = None
+        self._plot_key = None
+        self._svg = None
+
+    def _abstract_plot(self) -> AbstractPlot:
+        key = (len(self.graph.nodes), len(self.graph.edges))
+        if self._plot is None or self._plot_key != key:
+            self._plot = make_abstract_plot(self.graph)
+            self._plot_key = key
+        return self._plot
 
     def _repr_html_(self) -> str:
-        return render_svg(self.graph)
+        key = (len(self.graph.nodes), len(self.graph.edges))
+        if self._svg is None or key != self._plot_key:
+            self._svg = render(self._abstract_plot(), metro.svg_renderer())
+        return self._svg
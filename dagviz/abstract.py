@@ -60,6 +60,19 @@ class iRowBuilder(ABC):
 class AbstractColumn:
     "Column information for a single row."
 
+    # A plot holds one of these per (column, row) cell, and rendering walks
+    # all of them; slots keep the cells compact and make the attribute
+    # accesses in the render loop direct slot reads instead of dict lookups.
+    __slots__ = (
+        "column",
+        "start_row",
+        "next_row",
+        "color",
+        "remaining",
+        "is_input",
+        "is_node",
+    )
+
     column: int
     "The column number, can be positive and negative."
 
@@ -113,6 +126,8 @@ class AbstractRow:
     A row is iterable, iterating over the columns from left to right.
     """
 
+    __slots__ = ("_builder", "row", "columns", "label")
+
     _builder: iRowBuilder
     row: int
     "The 0-based index of this row"
@@ -12,10 +12,14 @@ g.add_edge("a","b")
 Dagre(g)
 ```
 """
+from __future__ import annotations
+
 import json
 from string import Template
+from typing import TYPE_CHECKING
 
-import networkx as nx
+if TYPE_CHECKING:
+    import networkx as nx
 
 _css_text = """
 text {
@@ -20,69 +20,72 @@ def render(plot: AbstractPlot, styler: Callable[..., iStyle]) -> str:
     # Initialize the style using the provided styler function
     style: iStyle = styler(plot.colors, -plot.columns.start)
 
+    # The place_* methods run once per column of every row; bind them to
+    # locals so the loop does not repeat the attribute lookups.
+    place_node = style.place_node
+    place_left_hline = style.place_left_hline
+    place_right_hline = style.place_right_hline
+    place_left_arc = style.place_left_arc
+    place_right_arc = style.place_right_arc
+    place_vline_arc = style.place_vline_arc
+    place_vline_node = style.place_vline_node
+    place_label = style.place_label
+
     # Iterate over each row in the plot
     for row in plot.rows:
+        rowidx = row.row
+        label = row.label
         last_col = 0
         arcs: List[AbstractColumn] = []
         nodepos = (0, 0)
-        node_pos = 1
+        seen_node = False
 
         # Iterate over each column in the row
         for col in row:
-            last_col = col.column
-            curpos = (col.column, row.row)
+            last_col = column = col.column
+            curpos = (column, rowidx)
 
             # If the column is a node, place the node and handle arcs
             if col.is_node:
                 nodepos = curpos
-                style.place_node(curpos, col.color, row.label)
+                place_node(curpos, col.color, label)
                 if len(arcs) != 0:
-                    style.place_left_hline(
-                        (arcs[0].column, row.row), curpos, arcs[0].color
-                    )
+                    place_left_hline((arcs[0].column, rowidx), curpos, arcs[0].color)
                     arcs = []
                 arcs.append(col)
-                node_pos = 0
-
-            # If the column is an input, place arcs and vertical lines
-            if col.is_input:
-                if node_pos < 0:
-                    arcs.append(col)
-                    style.place_left_arc(curpos, col.color)
-                    if col.is_last:
-                        style.place_vline_arc(
-                            (col.column, col.start_row.row),
-                            curpos,
-                            col.start_row.columns[col.column].color,
-                        )
-                elif node_pos == 0:
-                    style.place_vline_node(
-                        (col.column, col.start_row.row),
+                # The node can land on a column that is also one of its own
+                # inputs, when the column was freed earlier in this row and
+                # reused; the input then connects straight down to the node.
+                if col.is_input:
+                    start_row = col.start_row
+                    place_vline_node(
+                        (column, start_row.row),
                         curpos,
-                        col.start_row.columns[col.column].color,
+                        start_row.columns[column].color,
                     )
-                else:
-                    arcs.append(col)
-                    style.place_right_arc(curpos, col.color)
-                    if col.is_last:
-                        style.place_vline_arc(
-                            (col.column, col.start_row.row),
-                            curpos,
-                            col.start_row.columns[col.column].color,
-                        )
+                seen_node = True
 
-            # Update node position
-            if col.is_node:
-                node_pos = -1
+            # Otherwise, if the column is an input, place arcs and vertical lines
+            elif col.is_input:
+                start_row = col.start_row
+                startpos = (column, start_row.row)
+                start_color = start_row.columns[column].color
+                arcs.append(col)
+                if seen_node:
+                    place_left_arc(curpos, col.color)
+                else:
+                    place_right_arc(curpos, col.color)
+                if col.is_last:
+                    place_vline_arc(startpos, curpos, start_color)
 
         # Place horizontal line if there are multiple arcs
         if len(arcs) >= 2:
-            style.place_right_hline(
-                (arcs[0].column, row.row), (arcs[-1].column, row.row), arcs[-1].color
+            place_right_hline(
+                (arcs[0].column, rowidx), (arcs[-1].column, rowidx), arcs[-1].color
             )
 
         # Place the label for the row
-        style.place_label(nodepos, (last_col + 1, row.row), row.label)
+        place_label(nodepos, (last_col + 1, rowidx), label)
 
     # Return the SVG content as a string
     return style.dumps()
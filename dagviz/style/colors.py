@@ -2,7 +2,37 @@
 Color palette generation.
 """
 from colorsys import hls_to_rgb
-from typing import List, Sequence
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+
+@lru_cache(maxsize=8)
+def _make_palette(ncolors: int) -> Tuple[str, ...]:
+    "Walk the hue/lightness state machine and format the colors."
+    colors: List[str] = []
+    hue, lightness, saturation = 0.0, 1.0, 0.5
+    for i in range(ncolors):
+        # Convert HLS to RGB
+        r, g, b = hls_to_rgb(hue / 6, 0.4 + (lightness / 2) * 0.3, saturation)
+        # Update hue and lightness
+        hue = (hue + 1) % 7
+        if hue == 0:
+            lightness = (lightness + 1) % 3
+        # Append the color in hexadecimal format; clamp to 255 so that a
+        # channel at 1.0 cannot overflow into a three-digit component.
+        colors.append(
+            "#{:02x}{:02x}{:02x}".format(
+                min(int(r * 256), 255), min(int(g * 256), 255), min(int(b * 256), 255)
+            )
+        )
+    return tuple(colors)
+
+
+# The palette is a deterministic sequence, so any request is a prefix of a
+# long enough one. Precompute a generous prefix once at import; palette()
+# is then a slice for every realistic color count.
+_LUT_SIZE = 256
+_LUT = _make_palette(_LUT_SIZE)
 
 
 def palette(ncolors: int) -> Sequence[str]:
@@ -16,15 +46,6 @@ def palette(ncolors: int) -> Sequence[str]:
     Returns:
         A sequence of color strings in hexadecimal format.
     """
-    colors: List[str] = []
-    hue, lightness, saturation = 0.0, 1.0, 0.5
-    for i in range(ncolors):
-        # Convert HLS to RGB
-        r, g, b = hls_to_rgb(hue / 6, 0.4 + (lightness / 2) * 0.3, saturation)
-        # Update hue and lightness
-        hue = (hue + 1) % 7
-        if hue == 0:
-            lightness = (lightness + 1) % 3
-        # Append the color in hexadecimal format
-        colors.append(f"#{int(r * 256):02x}{int(g * 256):02x}{int(b * 256):02x}")
-    return colors
+    if ncolors <= _LUT_SIZE:
+        return _LUT[:ncolors]
+    return _make_palette(ncolors)
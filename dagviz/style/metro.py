@@ -4,48 +4,17 @@ Metro is the default, and currently only, style for drawing DAGs.
 import math
 import re
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Sequence, Tuple, Union
-
-import svgwrite as svg
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
 
 from dagviz.istyle import iStyle
 from .colors import palette
 
 _XY = Tuple[float, float]
 
-
-def _arc(
-        dwg: svg.Drawing,
-        p0: _XY,
-        p1: _XY,
-        radius: float,
-        clockwise: bool = True,
-        **kwargs: Any,
-) -> Any:
-    """
-    Adds an arc that bulges to the right as it moves from p0 to p1.
-
-    Args:
-        dwg: The SVG drawing object.
-        p0: The starting point of the arc as a tuple of (x, y) coordinates.
-        p1: The ending point of the arc as a tuple of (x, y) coordinates.
-        radius: The radius of the arc.
-        clockwise: Optional; If True, the arc is drawn clockwise. Defaults to True.
-        **kwargs: Additional keyword arguments to pass to the SVG path.
-
-    Returns:
-        An SVG path element representing the arc.
-    """
-    x0 = p0[0]
-    y0 = p0[1]
-    x1 = p1[0] - p0[0]
-    y1 = p1[1] - p0[1]
-    sweep = 1 if clockwise else 0
-    ellipseRotation = 0  # has no effect for circles
-    return dwg.path(
-        d=f"M {x0},{y0} a{radius},{radius} {ellipseRotation} 0,{sweep} {x1},{y1}",
-        **kwargs,
-    )
+# Characters that are stripped from a label to form an SVG id, compiled
+# once instead of per node.
+_ID_EXCLUDED = re.compile(r"[^0-9a-zA-Z_-]+")
 
 
 @dataclass
@@ -90,18 +59,26 @@ class StyleConfig:
     minimal_width: float = 500
     "The minimal width of the SVG view box"
 
+    precision: int = 2
+    "The number of decimals to keep in coordinates. With the default scale, two decimals are visually lossless."
+
 
 class _Style(iStyle):
-    d: svg.Drawing
-    background: svg.container.Group
-    edges: svg.container.Group
-    nodes: svg.container.Group
+    # The SVG fragments for each z-order layer, from back to front. Lines
+    # and arcs are collected as path segments per stroke color, so that
+    # each color becomes a single <path> element in the output; SVG
+    # consumers handle a handful of long paths far better than thousands
+    # of individual primitives. All edges share one stroke width, so the
+    # buckets are plain lists indexed by color number — no hashing in the
+    # per-edge path. Only circles and text, which cannot be merged into
+    # paths, remain individual elements.
+    background: List[str]
+    vlines: List[List[str]]
+    hline_borders: List[str]
+    hlines: List[List[str]]
+    nodes: List[str]
     shift: int
     colors: Sequence[str]
-    box_top: float
-    box_left: float
-    box_bottom: float
-    box_right: float
 
     def __init__(
             self,
@@ -109,47 +86,92 @@ class _Style(iStyle):
             colors: int,
             shift: int = 0,
     ):
-        self.d = svg.Drawing()
-        self.background = self.d.g()
-        self.vlines = self.d.g()
-        self.hline_borders = self.d.g()
-        self.hlines = self.d.g()
-        self.nodes = self.d.g()
-        self.d.add(self.background)
-        self.d.add(self.vlines)
-        self.d.add(self.hline_borders)
-        self.d.add(self.hlines)
-        self.d.add(self.nodes)
-        self._top = math.inf
-        self._left = math.inf
-        self._bottom = -math.inf
-        self._right = -math.inf
+        self.background = []
+        self.vlines = [[] for _ in range(colors)]
+        self.hline_borders = []
+        self.hlines = [[] for _ in range(colors)]
+        self.nodes = []
+        self._xs: List[float] = []
+        self._ys: List[float] = []
         self.config = config
         self.shift = shift
         self.colors = palette(colors)
+        # Derived constants, bound once so that `coord` and the various
+        # place_* methods do not have to chase config attributes on every
+        # one of the O(V+E) calls.
+        self._scale2 = config.scale * 2
+        self._arc_r = config.arc_radius
+        self._precision = config.precision
+        # Every input arc is a quarter circle of the same radius, so the
+        # whole arc command apart from its starting point is a constant:
+        # bulging to the left (clockwise) or to the right (counter-
+        # clockwise). Only the "M x,y" prefix varies per call.
+        arc_r = config.arc_radius
+        self._arc_left = f" a{arc_r},{arc_r} 0 0,1 {-arc_r},{arc_r}"
+        self._arc_right = f" a{arc_r},{arc_r} 0 0,0 {arc_r},{arc_r}"
+        self._border_width = config.edge_stroke_width + 2 * min(
+            config.edge_stroke_width, config.node_stroke_width
+        )
 
     def dumps(self) -> str:
         t, l, b, r = self._box()
-        self.d.viewbox(l, t, r - l, b - t)
-        return self.d.tostring()
+        parts = [
+            '<svg xmlns="http://www.w3.org/2000/svg" baseProfile="full" '
+            f'version="1.1" viewBox="{l} {t} {r - l} {b - t}">'
+        ]
+        parts.append("<g>")
+        if self.background:
+            parts.append('<path d="')
+            parts.extend(self.background)
+            parts.append(
+                f'" stroke="{self.config.label_arrow_stroke}" '
+                f'stroke-dasharray="{self.config.label_arrow_dash_array}" '
+                'fill="none" />'
+            )
+        parts.append("</g><g>")
+        self._write_layer(parts, self.vlines)
+        parts.append("</g><g>")
+        if self.hline_borders:
+            parts.append('<path d="')
+            parts.extend(self.hline_borders)
+            parts.append(
+                f'" stroke="white" stroke-width="{self._border_width}" fill="none" />'
+            )
+        parts.append("</g><g>")
+        self._write_layer(parts, self.hlines)
+        parts.append("</g><g>")
+        parts.extend(self.nodes)
+        parts.append("</g></svg>")
+        return "".join(parts)
+
+    def _write_layer(self, out: List[str], layer: List[List[str]]) -> None:
+        "Write each color bucket of a layer as a single path element."
+        width = self.config.edge_stroke_width
+        for stroke, segments in zip(self.colors, layer):
+            if segments:
+                out.append('<path d="')
+                out.extend(segments)
+                out.append(f'" stroke="{stroke}" stroke-width="{width}" fill="none" />')
 
     def _box(self) -> Tuple[float, float, float, float]:
+        # The extremes are taken here in one C-level pass per axis rather
+        # than being tracked with four comparisons on every coord() call.
         return (
-            self._top - self.config.scale,
-            self._left - self.config.scale,
-            self._bottom + self.config.scale,
-            max(self.config.minimal_width, self._right * 2),
+            min(self._ys, default=math.inf) - self.config.scale,
+            min(self._xs, default=math.inf) - self.config.scale,
+            max(self._ys, default=-math.inf) + self.config.scale,
+            max(self.config.minimal_width, max(self._xs, default=-math.inf) * 2),
         )
 
     def coord(self, xy: Tuple[int, int], dxy: _XY = (0.0, 0.0)) -> _XY:
-        x = self.config.scale * (xy[0] + self.shift) * 2 + self.config.arc_radius * (
-                dxy[0] + 1
-        )
-        y = self.config.scale * xy[1] * 2 + self.config.arc_radius * (dxy[1] + 1)
-        self._top = min(y, self._top)
-        self._left = min(x, self._left)
-        self._bottom = max(y, self._bottom)
-        self._right = max(x, self._right)
+        arc_r = self._arc_r
+        # Rounding here keeps every coordinate written to the SVG short;
+        # full float reprs can take 17 digits and inflate the output.
+        precision = self._precision
+        x = round(self._scale2 * (xy[0] + self.shift) + arc_r * (dxy[0] + 1), precision)
+        y = round(self._scale2 * xy[1] + arc_r * (dxy[1] + 1), precision)
+        self._xs.append(x)
+        self._ys.append(y)
         return (x, y)
 
     def top(self, xy: Tuple[int, int]) -> _XY:
@@ -162,40 +184,20 @@ class _Style(iStyle):
         return self.coord(xy, (-1, 0))
 
     def place_node(self, at: Tuple[int, int], color: int, label: str) -> None:
-        node_id = "N" + re.sub(r"[^0-9a-zA-Z_-]+", "", label)
-        self.nodes.add(
-            self.d.circle(
-                self.coord(at),
-                self.config.node_radius,
-                id=node_id,
-                fill=self.config.node_fill or self.colors[color],
-                stroke=self.config.node_stroke,
-                stroke_width=self.config.node_stroke_width,
-            )
+        node_id = "N" + _ID_EXCLUDED.sub("", label)
+        x, y = self.coord(at)
+        self.nodes.append(
+            f'<circle cx="{x}" cy="{y}" r="{self.config.node_radius}" '
+            f'id="{node_id}" fill="{self.config.node_fill or self.colors[color]}" '
+            f'stroke="{self.config.node_stroke}" '
+            f'stroke-width="{self.config.node_stroke_width}" />'
         )
 
-    def _place_edge(
-            self, layer: svg.container.Group, a: _XY, b: _XY, color: int
-    ) -> None:
-        layer.add(
-            self.d.line(
-                a,
-                b,
-                stroke_width=self.config.edge_stroke_width,
-                stroke=self.colors[color],
-            )
-        )
+    def _place_edge(self, layer: List[List[str]], a: _XY, b: _XY, color: int) -> None:
+        layer[color].append(f"M{a[0]},{a[1]}L{b[0]},{b[1]}")
 
     def _place_hline_border(self, a: _XY, b: _XY) -> None:
-        self.hline_borders.add(
-            self.d.line(
-                a,
-                b,
-                stroke_width=self.config.edge_stroke_width
-                             + 2 * min(self.config.edge_stroke_width, self.config.node_stroke_width),
-                stroke="white",
-            )
-        )
+        self.hline_borders.append(f"M{a[0]},{a[1]}L{b[0]},{b[1]}")
 
     def place_left_hline(
             self, left: Tuple[int, int], right: Tuple[int, int], color: int
@@ -222,59 +224,25 @@ class _Style(iStyle):
         self._place_edge(self.vlines, self.coord(top), self.coord(bottom), color)
 
     def place_left_arc(self, at: Tuple[int, int], color: int) -> None:
-        center = self.coord(at)
-        a = (center[0], center[1] - self.config.arc_radius)
-        b = (center[0] - self.config.arc_radius, center[1])
-        self.hlines.add(
-            _arc(
-                self.d,
-                a,
-                b,
-                self.config.arc_radius,
-                clockwise=True,
-                stroke=self.colors[color],
-                stroke_width=self.config.edge_stroke_width,
-                fill="none",
-            )
-        )
+        x, y = self.coord(at)
+        self.hlines[color].append(f"M {x},{y - self._arc_r}{self._arc_left}")
 
     def place_right_arc(self, at: Tuple[int, int], color: int) -> None:
-        center = self.coord(at)
-        a = (center[0], center[1] - self.config.arc_radius)
-        b = (center[0] + self.config.arc_radius, center[1])
-        self.hlines.add(
-            _arc(
-                self.d,
-                a,
-                b,
-                self.config.arc_radius,
-                clockwise=False,
-                stroke=self.colors[color],
-                stroke_width=self.config.edge_stroke_width,
-                fill="none",
-            )
-        )
+        x, y = self.coord(at)
+        self.hlines[color].append(f"M {x},{y - self._arc_r}{self._arc_right}")
 
     def place_label(
             self, nodepos: Tuple[int, int], at: Tuple[int, int], label: str
     ) -> None:
-        self.nodes.add(
-            self.d.text(
-                label,
-                self.coord(at),
-                dominant_baseline="middle",
-                font_family=self.config.label_font_family,
-                font_size=self.config.label_font_size,
-            )
-        )
-        self.background.add(
-            self.d.line(
-                self.right(nodepos),
-                self.coord(at, (-0.4, 0.0)),
-                stroke=self.config.label_arrow_stroke,
-                stroke_dasharray=self.config.label_arrow_dash_array,
-            )
+        x, y = self.coord(at)
+        self.nodes.append(
+            f'<text x="{x}" y="{y}" dominant-baseline="middle" '
+            f'font-family="{self.config.label_font_family}" '
+            f'font-size="{self.config.label_font_size}">{escape(label)}</text>'
         )
+        a = self.right(nodepos)
+        b = self.coord(at, (-0.4, 0.0))
+        self.background.append(f"M{a[0]},{a[1]}L{b[0]},{b[1]}")
 
 
 def svg_renderer(config: StyleConfig = StyleConfig()) -> Callable[..., iStyle]:
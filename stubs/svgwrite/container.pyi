@@ -1,4 +0,0 @@
-from typing import Any
-
-class Group:
-    def add(self, element: Any) -> None: ...
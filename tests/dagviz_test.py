@@ -1,8 +1,10 @@
 import unittest
+import xml.dom.minidom
 
 import networkx as nx
 
 import dagviz
+from dagviz.style.colors import palette
 
 
 class DagvizTest(unittest.TestCase):
@@ -65,3 +67,46 @@ class DagvizTest(unittest.TestCase):
         r = dagviz.Metro(G)._repr_html_()
         self.assertTrue(r.startswith("<svg"))
         self.assertTrue(r.endswith("</svg>"))
+
+    def test_palette_format(self):
+        # Every color must be a well-formed hex triplet; a channel at 1.0
+        # used to overflow into a three-digit component.
+        for n in (1, 16, 300):
+            for color in palette(n):
+                self.assertRegex(color, r"^#[0-9a-f]{6}$")
+
+    def test_Metro_cache(self):
+        G = nx.DiGraph()
+        G.add_edge("n0", "n1")
+        m = dagviz.Metro(G)
+        first = m._repr_html_()
+        self.assertIs(m._repr_html_(), first)
+        G.add_edge("n1", "n2")
+        second = m._repr_html_()
+        self.assertNotEqual(second, first)
+        self.assertIn("n2", second)
+        # A relabel keeps the node and edge counts, so the cache goes
+        # stale until it is explicitly invalidated.
+        nx.relabel_nodes(G, {"n2": "n3"}, copy=False)
+        self.assertIs(m._repr_html_(), second)
+        m.invalidate()
+        self.assertIn("n3", m._repr_html_())
+
+    def test_render_svg_shape(self):
+        G = nx.DiGraph()
+        for i in range(5):
+            G.add_node(f"n{i}")
+        G.add_edge(f"n0", f"n1")
+        G.add_edge(f"n0", f"n2")
+        G.add_edge(f"n0", f"n4")
+        G.add_edge(f"n1", f"n3")
+        G.add_edge(f"n2", f"n3")
+        G.add_edge(f"n3", f"n4")
+        r = dagviz.render_svg(G)
+        xml.dom.minidom.parseString(r)
+        self.assertIn("viewBox", r)
+        self.assertEqual(r.count("<circle"), 5)
+        self.assertEqual(r.count("<text"), 5)
+        self.assertGreaterEqual(r.count("<path"), 1)
+        # Rendering is deterministic, so a repeat render is identical.
+        self.assertEqual(r, dagviz.render_svg(G))